@@ -4,30 +4,41 @@ Startup script for the Blog Scraper FastAPI server
 """
 import uvicorn
 import os
-import sys
 from pathlib import Path
 
 if __name__ == "__main__":
     # Get the project root directory
-    project_root = Path(__file__).parent.parent
-    
-    # Change to the project root so relative imports work
-    os.chdir(project_root)
-    
-    # Add the project root to Python path
-    sys.path.insert(0, str(project_root))
+    project_root = Path(__file__).resolve().parent.parent
     
     # Add the API module path
     api_module_path = "web-interface.src.app.api.scrape.main"
     
-    print(f"Starting FastAPI server from: {os.getcwd()}")
+    print(f"Project root: {project_root}")
     print(f"Loading module: {api_module_path}")
     
+    # DEV=1 enables auto-reload (single process); otherwise run multiple workers
+    dev_mode = os.environ.get("DEV") == "1"
+    workers = 1 if dev_mode else int(os.environ.get("WORKERS", min(os.cpu_count() or 2, 4)))
+    
+    if dev_mode:
+        print("Mode: development (auto-reload)")
+    else:
+        print(f"Mode: production ({workers} workers)")
+    
     # Run the FastAPI server
     uvicorn.run(
         f"{api_module_path}:app",
+        app_dir=str(project_root),  # uvicorn puts this on sys.path in every worker/reload process
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Enable auto-reload during development
-        log_level="info"
-    ) 
\ No newline at end of file
+        reload=dev_mode,
+        reload_dirs=[str(project_root)] if dev_mode else None,
+        workers=workers,
+        # Per-request access logs only in development; production keeps warnings and errors
+        log_level="info" if dev_mode else "warning",
+        access_log=dev_mode,
+        loop="uvloop",  # libuv event loop, shipped with uvicorn[standard]
+        http="httptools",
+        timeout_keep_alive=30,  # keep connections open for clients polling /jobs or batching scrapes
+        limit_concurrency=200  # answer 503 instead of queueing without bound
+    )
@@ -1,14 +1,37 @@
 import sys
 import os
+import asyncio
+import fcntl
+import hashlib
+import time
+import threading
+import uuid
+from collections import OrderedDict
+from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, HttpUrl
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, TypeAdapter
 import logging
+import orjson
 
-# Since we're running from project root, we can import directly from src
-sys.path.insert(0, "src")
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Resolve the project root from this file so imports and output paths don't depend on the working directory
+PROJECT_ROOT = Path(__file__).resolve().parents[5]
+for import_path in (str(PROJECT_ROOT), str(PROJECT_ROOT / "src")):
+    if import_path not in sys.path:
+        sys.path.insert(0, import_path)
 
 try:
     from src.scraper_manager import ScraperManager
@@ -18,19 +41,141 @@ try:
     from src.generic_blog_scraper import GenericBlogScraper
     from src.pdf_processor import PDFProcessor
     
-    print("All scrapers imported successfully!")
+    logger.info("All scrapers imported successfully")
     
 except ImportError as e:
-    print(f"Import error: {e}")
-    print(f"Current working directory: {os.getcwd()}")
-    print(f"Python path: {sys.path}")
+    logger.error(f"Import error: {e} (project root: {PROJECT_ROOT}, python path: {sys.path})")
     raise
 
+# Entered scraper instances kept alive between requests
+SCRAPER_POOL_MAX_IDLE = 8
+# Idle scrapers unused for this long are closed, so stale sessions and browser drivers aren't kept forever
+SCRAPER_POOL_IDLE_TIMEOUT = float(os.environ.get("SCRAPER_POOL_IDLE_TIMEOUT", 300))  # seconds, 0 disables pooling
+
+class ScraperPool:
+    """Reuses entered scrapers across requests so their HTTP sessions (and browser
+    drivers) stay warm. Each instance is checked out by one request at a time."""
+    
+    def __init__(self, max_idle: int, idle_timeout: float):
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        # Idle instances per key as (time returned to the pool, scraper), oldest first
+        self._idle: Dict[Tuple[type, bytes], List[Tuple[float, Any]]] = {}
+        self._idle_count = 0
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def acquire(self, scraper_cls: type, config: ScrapingConfig, config_dict: Optional[Dict]) -> Iterator[Any]:
+        key = (scraper_cls, orjson.dumps(config_dict or {}, option=orjson.OPT_SORT_KEYS, default=str))
+        self.expire_idle()
+        
+        with self._lock:
+            instances = self._idle.get(key)
+            scraper = instances.pop()[1] if instances else None
+            if scraper is not None:
+                self._idle_count -= 1
+        
+        if scraper is None:
+            scraper = scraper_cls(config).__enter__()
+        
+        try:
+            yield scraper
+        except BaseException:
+            # Don't hand a scraper that failed mid-scrape to the next request
+            scraper.__exit__(*sys.exc_info())
+            raise
+        
+        with self._lock:
+            if self.idle_timeout > 0 and self._idle_count < self.max_idle:
+                self._idle.setdefault(key, []).append((time.monotonic(), scraper))
+                self._idle_count += 1
+                return
+        scraper.__exit__(None, None, None)
+    
+    def expire_idle(self) -> None:
+        """Close scrapers that have sat in the pool longer than idle_timeout"""
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = []
+        with self._lock:
+            for key, instances in list(self._idle.items()):
+                while instances and instances[0][0] < cutoff:
+                    expired.append(instances.pop(0)[1])
+                if not instances:
+                    del self._idle[key]
+            self._idle_count -= len(expired)
+        
+        self._exit_all(expired)
+    
+    def close(self) -> None:
+        with self._lock:
+            idle = [scraper for instances in self._idle.values() for _, scraper in instances]
+            self._idle.clear()
+            self._idle_count = 0
+        
+        self._exit_all(idle)
+    
+    def _exit_all(self, scrapers: List[Any]) -> None:
+        for scraper in scrapers:
+            try:
+                scraper.__exit__(None, None, None)
+            except Exception as e:
+                logger.warning(f"Failed to close pooled scraper: {e}")
+
+scraper_pool = ScraperPool(SCRAPER_POOL_MAX_IDLE, SCRAPER_POOL_IDLE_TIMEOUT)
+
+async def expire_idle_scrapers() -> None:
+    """Close idle pooled scrapers even when no requests arrive to trigger it"""
+    while True:
+        await asyncio.sleep(max(SCRAPER_POOL_IDLE_TIMEOUT, 1))
+        await run_in_threadpool(scraper_pool.expire_idle)
+
+# Set WARMUP_SCRAPERS=1 to enter the scrapers at startup. Off by default because it
+# runs in every worker process and may start a browser driver in each.
+WARMUP_SCRAPERS = os.environ.get("WARMUP_SCRAPERS") == "1"
+
+def warm_scraper_pool() -> None:
+    """Enter one default-config instance of each scraper so the first request
+    doesn't pay for lazy imports, session and browser driver setup"""
+    for scraper_cls in (NilMamanoScraper, InterviewingIOScraper, GenericBlogScraper, PDFProcessor):
+        try:
+            with scraper_pool.acquire(scraper_cls, DEFAULT_CONFIG, None):
+                pass
+        except Exception as e:
+            logger.warning(f"Failed to warm up {scraper_cls.__name__}: {e}")
+
+# Set API_DOCS=0 to skip OpenAPI schema generation and the /docs, /redoc and /openapi.json routes
+API_DOCS_ENABLED = os.environ.get("API_DOCS", "1") != "0"
+
+def get_openapi_bytes(app: FastAPI) -> bytes:
+    """OpenAPI schema serialized once and reused for every /openapi.json request"""
+    if getattr(app.state, "openapi_bytes", None) is None:
+        app.state.openapi_bytes = orjson.dumps(app.openapi())
+    return app.state.openapi_bytes
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if API_DOCS_ENABLED:
+        get_openapi_bytes(app)
+    if WARMUP_SCRAPERS:
+        await run_in_threadpool(warm_scraper_pool)
+    pool_sweeper = asyncio.create_task(expire_idle_scrapers()) if SCRAPER_POOL_IDLE_TIMEOUT > 0 else None
+    yield
+    if pool_sweeper is not None:
+        pool_sweeper.cancel()
+    background_executor.shutdown(wait=False)
+    await run_in_threadpool(scraper_pool.close)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Blog Scraper API",
     description="API for scraping various blog sources and processing PDFs",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+    # Served by the pre-rendered routes below instead of FastAPI's defaults
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None
 )
 
 # Add CORS middleware
@@ -42,17 +187,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Scrape results are text-heavy and compress well
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # Request/Response models
 class ScrapeRequest(BaseModel):
-    url: Optional[HttpUrl] = None
+    url: Optional[str] = None
     config: Optional[Dict] = None
 
 class GenericBlogRequest(BaseModel):
-    blog_url: HttpUrl
+    blog_url: str
     config: Optional[Dict] = None
 
 class PDFRequest(BaseModel):
@@ -61,14 +205,281 @@ class PDFRequest(BaseModel):
     config: Optional[Dict] = None
 
 class ScrapeAllRequest(BaseModel):
-    google_drive_pdf_url: Optional[HttpUrl] = None
+    google_drive_pdf_url: Optional[str] = None
     config: Optional[Dict] = None
 
-# Helper function to create scraping config
+class JobState(BaseModel):
+    job_id: str
+    status: str = "running"  # running, completed, failed
+    started_at: float
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    total_scraped: Optional[Dict[str, int]] = None
+
+# Background scrape jobs, pollable via /jobs/{job_id}. Job state and locks are files under
+# JOBS_DIR so every worker process sees the same jobs, whichever one a request lands on.
+JOBS_DIR = PROJECT_ROOT / "output" / ".jobs"
+JOB_HISTORY_LIMIT = 100
+MAX_BACKGROUND_JOBS = int(os.environ.get("MAX_BACKGROUND_JOBS", 2))
+
+# Each job runs a full multi-source scrape, so only MAX_BACKGROUND_JOBS may run at once across
+# all workers, each holding the flock on one slot file; extra requests get a 503
+background_executor = ThreadPoolExecutor(max_workers=MAX_BACKGROUND_JOBS, thread_name_prefix="scrape-job")
+
+def try_lock_file(path: Path) -> Optional[int]:
+    """Take an exclusive flock on path without blocking, creating the file if needed.
+    Returns the open fd, which holds the lock until it is closed, or None if another
+    holder has it. The kernel drops the lock when its process exits, so a killed
+    worker never leaves it held."""
+    JOBS_DIR.mkdir(parents=True, exist_ok=True)
+    while True:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        except BaseException:
+            os.close(fd)
+            raise
+        try:
+            # The previous holder may have removed the file between our open and flock; lock the new one
+            if os.path.samestat(os.fstat(fd), os.stat(path)):
+                return fd
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+
+def unlock_file(path: Path, fd: int, remove: bool = False) -> None:
+    """Release a lock taken with try_lock_file, removing the file first if remove is set"""
+    try:
+        if remove:
+            path.unlink(missing_ok=True)
+    finally:
+        os.close(fd)
+
+def read_lock_owner(path: Path) -> Optional[str]:
+    """Job ID written into a request lock by its holder, or None if the lock is gone"""
+    for _ in range(10):
+        try:
+            owner = path.read_text()
+        except FileNotFoundError:
+            return None
+        if owner:
+            return owner
+        time.sleep(0.01)  # the holder writes its job ID just after taking the lock
+    return None
+
+def job_running(job_id: str, request_lock: Path) -> bool:
+    """Whether a live process still holds request_lock for job_id"""
+    fd = try_lock_file(request_lock)
+    if fd is not None:
+        unlock_file(request_lock, fd, remove=True)
+        return False
+    return read_lock_owner(request_lock) == job_id
+
+def claim_background_slot() -> Optional[Tuple[Path, int]]:
+    """Lock a free background job slot shared by all workers, or None if all are taken"""
+    for slot in range(MAX_BACKGROUND_JOBS):
+        slot_lock = JOBS_DIR / f"slot-{slot}.lock"
+        slot_fd = try_lock_file(slot_lock)
+        if slot_fd is not None:
+            return slot_lock, slot_fd
+    return None
+
+def job_path(job_id: str) -> Path:
+    return JOBS_DIR / f"{job_id}.json"
+
+def save_job(job: JobState, request_lock: Path) -> None:
+    """Write the job's state file atomically, recording the request lock its worker holds"""
+    JOBS_DIR.mkdir(parents=True, exist_ok=True)
+    path = job_path(job.job_id)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(orjson.dumps({**job.model_dump(), "request_lock": request_lock.name}))
+    os.replace(tmp, path)
+
+def read_job_file(job_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        return orjson.loads(job_path(job_id).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def load_job(job_id: str) -> Optional[JobState]:
+    data = read_job_file(job_id)
+    if data is not None and data["status"] == "running" and not job_running(job_id, JOBS_DIR / data["request_lock"]):
+        # The job may have finished between reading its file and checking its lock
+        data = read_job_file(job_id)
+        if data is not None and data["status"] == "running":
+            data.update(status="failed", error="Worker process exited before the job finished")
+    return JobState.model_validate(data) if data is not None else None
+
+def prune_finished_jobs() -> None:
+    """Drop the oldest finished jobs once the history grows past JOB_HISTORY_LIMIT"""
+    try:
+        paths = sorted(JOBS_DIR.glob("*.json"), key=lambda path: path.stat().st_mtime)
+    except FileNotFoundError:
+        return  # another worker is pruning
+    for path in paths[:max(0, len(paths) - JOB_HISTORY_LIMIT)]:
+        job = load_job(path.stem)
+        if job is not None and job.status != "running":
+            path.unlink(missing_ok=True)
+
+# Predefined single-source scrapes served by POST /scrape/{source}:
+# source -> (scraper class, scrape method, default URL, description)
+SCRAPE_SOURCES: Dict[str, Tuple[type, str, str, str]] = {
+    "nilmamano": (NilMamanoScraper, "scrape_dsa_posts", "https://nilmamano.com/blog/category/dsa", "Scrape DS&A posts from nilmamano.com"),
+    "interviewing-io/blog": (InterviewingIOScraper, "scrape_blog", "https://interviewing.io/blog", "Scrape blog posts from interviewing.io"),
+    "interviewing-io/company-guides": (InterviewingIOScraper, "scrape_company_guides", "https://interviewing.io/topics#companies", "Scrape company guides from interviewing.io"),
+    "interviewing-io/interview-guides": (InterviewingIOScraper, "scrape_interview_guides", "https://interviewing.io/learn#interview-guides", "Scrape interview guides from interviewing.io"),
+}
+# Valid values for the {source} path parameter, so they're validated and listed in the OpenAPI schema
+ScrapeSource = Enum("ScrapeSource", {source: source for source in SCRAPE_SOURCES}, type=str)
+INTERVIEWING_IO_SECTIONS = ["interviewing-io/blog", "interviewing-io/company-guides", "interviewing-io/interview-guides"]
+
+# Handlers dump scrape results to JSON-ready data in pydantic-core and return the response
+# themselves (response_model=None), so FastAPI neither re-validates the scrapers' models nor
+# walks them with jsonable_encoder. The responses= schemas keep them documented in OpenAPI.
+SCRAPING_RESULT_RESPONSES = {200: {"model": ScrapingResult}}
+SCRAPING_RESULT_LIST_RESPONSES = {200: {"model": List[ScrapingResult]}}
+SCRAPING_RESULT_DICT_RESPONSES = {200: {"model": Dict[str, ScrapingResult]}}
+SCRAPING_RESULT_JSON = TypeAdapter(ScrapingResult)
+SCRAPING_RESULT_LIST_JSON = TypeAdapter(List[ScrapingResult])
+SCRAPING_RESULT_DICT_JSON = TypeAdapter(Dict[str, ScrapingResult])
+
+def json_response(serializer: TypeAdapter, content: Any) -> ORJSONResponse:
+    # dump_python(mode="json") + orjson measured about twice as fast as dump_json on large results
+    return ORJSONResponse(serializer.dump_python(content, mode="json"))
+
+# In-process cache of scrape results so repeated identical requests skip the scrape
+RESULT_CACHE_TTL = float(os.environ.get("SCRAPE_CACHE_TTL", 3600))  # seconds, 0 disables
+RESULT_CACHE_MAX_ENTRIES = 128
+
+class ResultCache:
+    """TTL + LRU cache for scrape results. Only accessed from the event loop thread."""
+    
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+    
+    def get(self, key: bytes) -> Optional[Any]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: bytes, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+result_cache = ResultCache(RESULT_CACHE_TTL, RESULT_CACHE_MAX_ENTRIES)
+
+# Scrapes currently running, so concurrent identical requests share one scrape
+inflight_scrapes: Dict[bytes, "asyncio.Task"] = {}
+
+def cache_key(endpoint: str, target: Any, config_dict: Optional[Dict]) -> bytes:
+    """Stable 16-byte key for a scrape request: endpoint, target URL/path and config"""
+    payload = orjson.dumps(
+        {"endpoint": endpoint, "target": target, "config": config_dict or {}},
+        option=orjson.OPT_SORT_KEYS,
+        default=str
+    )
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+async def run_cached(key: bytes, run: Callable[[], Any]) -> Any:
+    """Return a cached result for key, join an identical scrape already in flight,
+    or run the blocking scrape in the threadpool and cache it"""
+    result = result_cache.get(key)
+    if result is not None:
+        logger.info("Serving scrape result from cache")
+        return result
+    
+    task = inflight_scrapes.get(key)
+    if task is None:
+        task = asyncio.ensure_future(run_in_threadpool(run))
+        inflight_scrapes[key] = task
+        
+        def finish(task: "asyncio.Task") -> None:
+            inflight_scrapes.pop(key, None)
+            if task.cancelled() or task.exception() is not None:
+                return
+            # Don't pin failed scrapes in the cache, including multi-source results where any source failed
+            result = task.result()
+            results = result.values() if isinstance(result, dict) else [result]
+            if all(getattr(r, "success", True) for r in results):
+                result_cache.set(key, result)
+        
+        task.add_done_callback(finish)
+    else:
+        logger.info("Joining identical scrape already in progress")
+    
+    # Shielded so a disconnecting client doesn't cancel the scrape other requests are waiting on
+    return await asyncio.shield(task)
+
+def ndjson_line(source: str, result: Optional[ScrapingResult] = None, error: Optional[str] = None) -> bytes:
+    """One NDJSON line carrying either a source's result or its error"""
+    if error is not None:
+        payload = {"source": source, "error": error}
+    else:
+        payload = {"source": source, "result": SCRAPING_RESULT_JSON.dump_python(result, mode="json")}
+    return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+
+async def stream_as_completed(scrapes: Dict[str, Awaitable]) -> AsyncIterator[bytes]:
+    """Yield an NDJSON line per source as soon as its scrape finishes"""
+    async def labelled(source: str, scrape: Awaitable):
+        try:
+            return source, await scrape, None
+        except Exception as e:
+            logger.error(f"Failed to scrape {source}: {e}")
+            return source, None, str(e)
+    
+    for next_done in asyncio.as_completed([labelled(source, scrape) for source, scrape in scrapes.items()]):
+        source, result, error = await next_done
+        yield ndjson_line(source, result, error)
+
+def validate_url(url: Optional[str], field: str) -> Optional[str]:
+    """Cheap scheme check for request URLs; the scrapers parse them properly downstream"""
+    if url is not None and not url.startswith(("http://", "https://")):
+        raise HTTPException(status_code=422, detail=f"{field} must be an http(s) URL")
+    return url
+
+def scrape_source(source: str, url: Optional[str], config_dict: Optional[Dict]) -> Awaitable[ScrapingResult]:
+    """Cached, coalesced scrape of one predefined source on a pooled scraper"""
+    scraper_cls, method_name, default_url, _ = SCRAPE_SOURCES[source]
+    url = url or default_url
+    config = create_config(config_dict)
+    
+    def run():
+        with scraper_pool.acquire(scraper_cls, config, config_dict) as scraper:
+            return getattr(scraper, method_name)(url)
+    
+    return run_cached(cache_key(f"/scrape/{source}", url, config_dict), run)
+
+# Helper function to create scraping config.
+# Configs are only read by the scrapers, so identical dicts share one validated instance.
+DEFAULT_CONFIG = ScrapingConfig()
+
+@lru_cache(maxsize=256)
+def _cached_config(config_items: Tuple[Tuple[str, Any], ...]) -> ScrapingConfig:
+    return ScrapingConfig(**dict(config_items))
+
 def create_config(config_dict: Optional[Dict] = None) -> ScrapingConfig:
-    if config_dict:
+    if not config_dict:
+        return DEFAULT_CONFIG
+    try:
+        return _cached_config(tuple(sorted(config_dict.items())))
+    except TypeError:
+        # Unhashable values (lists, nested dicts) can't be memoized
         return ScrapingConfig(**config_dict)
-    return ScrapingConfig()
 
 @app.get("/")
 async def root():
@@ -77,150 +488,116 @@ async def root():
         "message": "Blog Scraper API",
         "version": "1.0.0",
         "endpoints": {
-            "/scrape/nilmamano": "Scrape DS&A posts from nilmamano.com",
-            "/scrape/interviewing-io/blog": "Scrape blog posts from interviewing.io",
-            "/scrape/interviewing-io/company-guides": "Scrape company guides from interviewing.io",
-            "/scrape/interviewing-io/interview-guides": "Scrape interview guides from interviewing.io",
+            **{f"/scrape/{source}": description for source, (_, _, _, description) in SCRAPE_SOURCES.items()},
             "/scrape/interviewing-io/all": "Scrape all content from interviewing.io",
             "/scrape/generic-blog": "Scrape any generic blog",
             "/scrape/pdf": "Process PDF from URL or path",
-            "/scrape/all": "Scrape all predefined sources"
+            "/scrape/all": "Scrape all predefined sources",
+            "/scrape/all/background": "Scrape all predefined sources in the background",
+            "/jobs/{job_id}": "Status of a background scrape job"
         }
     }
 
-@app.post("/scrape/nilmamano", response_model=ScrapingResult)
-async def scrape_nilmamano(request: ScrapeRequest):
-    """Scrape DS&A posts from nilmamano.com"""
-    try:
-        config = create_config(request.config)
-        url = str(request.url) if request.url else "https://nilmamano.com/blog/category/dsa"
-        
-        with NilMamanoScraper(config) as scraper:
-            result = scraper.scrape_dsa_posts(url)
-            
-        logger.info(f"Nilmamano scrape completed: {result.total_scraped} entries")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to scrape nilmamano: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/scrape/interviewing-io/blog", response_model=ScrapingResult)
-async def scrape_interviewing_io_blog(request: ScrapeRequest):
-    """Scrape blog posts from interviewing.io"""
-    try:
-        config = create_config(request.config)
-        url = str(request.url) if request.url else "https://interviewing.io/blog"
-        
-        with InterviewingIOScraper(config) as scraper:
-            result = scraper.scrape_blog(url)
-            
-        logger.info(f"Interviewing.io blog scrape completed: {result.total_scraped} entries")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to scrape interviewing.io blog: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/scrape/interviewing-io/company-guides", response_model=ScrapingResult)
-async def scrape_interviewing_io_company_guides(request: ScrapeRequest):
-    """Scrape company guides from interviewing.io"""
-    try:
-        config = create_config(request.config)
-        url = str(request.url) if request.url else "https://interviewing.io/topics#companies"
-        
-        with InterviewingIOScraper(config) as scraper:
-            result = scraper.scrape_company_guides(url)
-            
-        logger.info(f"Interviewing.io company guides scrape completed: {result.total_scraped} entries")
-        return result
-        
-    except Exception as e:
-        logger.error(f"Failed to scrape interviewing.io company guides: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/scrape/interviewing-io/interview-guides", response_model=ScrapingResult)
-async def scrape_interviewing_io_interview_guides(request: ScrapeRequest):
-    """Scrape interview guides from interviewing.io"""
+@app.post("/scrape/interviewing-io/all", response_model=None, responses=SCRAPING_RESULT_LIST_RESPONSES)
+async def scrape_interviewing_io_all(request: ScrapeRequest, stream: bool = False) -> Response:
+    """Scrape all content from interviewing.io (blog, company guides, interview guides).
+    
+    With ?stream=true, results are sent as NDJSON lines as each section finishes.
+    """
     try:
-        config = create_config(request.config)
-        url = str(request.url) if request.url else "https://interviewing.io/learn#interview-guides"
+        # Sections hit different pages and each gets its own pooled scraper, so run them concurrently.
+        # They go through the same cache as the single-section endpoints, so results are shared.
+        scrapes = {
+            source.split("/")[-1]: scrape_source(source, None, request.config)
+            for source in INTERVIEWING_IO_SECTIONS
+        }
         
-        with InterviewingIOScraper(config) as scraper:
-            result = scraper.scrape_interview_guides(url)
-            
-        logger.info(f"Interviewing.io interview guides scrape completed: {result.total_scraped} entries")
-        return result
+        if stream:
+            return StreamingResponse(stream_as_completed(scrapes), media_type="application/x-ndjson")
         
-    except Exception as e:
-        logger.error(f"Failed to scrape interviewing.io interview guides: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/scrape/interviewing-io/all", response_model=List[ScrapingResult])
-async def scrape_interviewing_io_all(request: ScrapeRequest):
-    """Scrape all content from interviewing.io (blog, company guides, interview guides)"""
-    try:
-        config = create_config(request.config)
+        results = list(await asyncio.gather(*scrapes.values()))
         
-        with InterviewingIOScraper(config) as scraper:
-            results = scraper.scrape_all()
-            
         total_scraped = sum(result.total_scraped for result in results)
         logger.info(f"Interviewing.io all content scrape completed: {total_scraped} total entries")
-        return results
+        return json_response(SCRAPING_RESULT_LIST_JSON, results)
         
     except Exception as e:
         logger.error(f"Failed to scrape all interviewing.io content: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/scrape/generic-blog", response_model=ScrapingResult)
-async def scrape_generic_blog(request: GenericBlogRequest):
+@app.post("/scrape/generic-blog", response_model=None, responses=SCRAPING_RESULT_RESPONSES)
+async def scrape_generic_blog(request: GenericBlogRequest) -> Response:
     """Scrape any generic blog"""
+    validate_url(request.blog_url, "blog_url")
     try:
         config = create_config(request.config)
         
-        with GenericBlogScraper(config) as scraper:
-            result = scraper.scrape_blog(str(request.blog_url))
-            
+        def run():
+            with scraper_pool.acquire(GenericBlogScraper, config, request.config) as scraper:
+                return scraper.scrape_blog(request.blog_url)
+        
+        key = cache_key("/scrape/generic-blog", request.blog_url, request.config)
+        result = await run_cached(key, run)
+        
         logger.info(f"Generic blog scrape completed: {result.total_scraped} entries")
-        return result
+        return json_response(SCRAPING_RESULT_JSON, result)
         
     except Exception as e:
         logger.error(f"Failed to scrape generic blog: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/scrape/pdf", response_model=ScrapingResult)
-async def scrape_pdf(request: PDFRequest):
+@app.post("/scrape/pdf", response_model=None, responses=SCRAPING_RESULT_RESPONSES)
+async def scrape_pdf(request: PDFRequest) -> Response:
     """Process PDF from URL or local path"""
     try:
         config = create_config(request.config)
+        pdf_url_or_path = request.pdf_url_or_path
+        is_url = pdf_url_or_path.startswith('http')
+        if not is_url:
+            # Relative paths are relative to the project root, whichever directory the server was started from
+            path = Path(pdf_url_or_path)
+            pdf_url_or_path = str(path if path.is_absolute() else PROJECT_ROOT / path)
+        
+        def run():
+            with scraper_pool.acquire(PDFProcessor, config, request.config) as processor:
+                if is_url:
+                    return processor.scrape_google_drive_pdf(pdf_url_or_path, request.max_chapters)
+                return processor.scrape_local_pdf(pdf_url_or_path, request.max_chapters)
+        
+        key = cache_key("/scrape/pdf", [pdf_url_or_path, request.max_chapters], request.config)
+        result = await run_cached(key, run)
         
-        with PDFProcessor(config) as processor:
-            if request.pdf_url_or_path.startswith('http'):
-                result = processor.scrape_google_drive_pdf(request.pdf_url_or_path, request.max_chapters)
-            else:
-                result = processor.scrape_local_pdf(request.pdf_url_or_path, request.max_chapters)
-                
         logger.info(f"PDF processing completed: {result.total_scraped} chapters")
-        return result
+        return json_response(SCRAPING_RESULT_JSON, result)
         
     except Exception as e:
         logger.error(f"Failed to process PDF: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/scrape/all", response_model=Dict[str, ScrapingResult])
-async def scrape_all_sources(request: ScrapeAllRequest):
-    """Scrape all predefined sources"""
+@app.post("/scrape/all", response_model=None, responses=SCRAPING_RESULT_DICT_RESPONSES)
+async def scrape_all_sources(request: ScrapeAllRequest, stream: bool = False) -> Response:
+    """Scrape all predefined sources.
+    
+    With ?stream=true, results are sent as one NDJSON line per source instead of a single JSON object.
+    """
+    google_drive_url = validate_url(request.google_drive_pdf_url, "google_drive_pdf_url")
     try:
         config = create_config(request.config)
         manager = ScraperManager(config)
         
-        google_drive_url = str(request.google_drive_pdf_url) if request.google_drive_pdf_url else None
-        results = manager.scrape_all_sources(google_drive_url)
+        key = cache_key("/scrape/all", google_drive_url, request.config)
+        results = await run_cached(key, lambda: manager.scrape_all_sources(google_drive_url))
         
         total_scraped = sum(result.total_scraped for result in results.values())
         logger.info(f"All sources scrape completed: {total_scraped} total entries")
-        return results
+        
+        if stream:
+            # Serialize one source at a time rather than the whole result set at once
+            return StreamingResponse(
+                (ndjson_line(source, result) for source, result in results.items()),
+                media_type="application/x-ndjson"
+            )
+        return json_response(SCRAPING_RESULT_DICT_JSON, results)
         
     except Exception as e:
         logger.error(f"Failed to scrape all sources: {e}")
@@ -228,33 +605,128 @@ async def scrape_all_sources(request: ScrapeAllRequest):
 
 # Background task endpoints for long-running operations
 @app.post("/scrape/all/background")
-async def scrape_all_sources_background(request: ScrapeAllRequest, background_tasks: BackgroundTasks):
-    """Start scraping all sources in the background"""
+async def scrape_all_sources_background(request: ScrapeAllRequest):
+    """Start scraping all sources in the background and return a job ID to poll"""
+    google_drive_url = validate_url(request.google_drive_pdf_url, "google_drive_pdf_url")
+    key = cache_key("/scrape/all/background", google_drive_url, request.config)
+    request_lock = JOBS_DIR / f"request-{key.hex()}.lock"
+    job = JobState(job_id=uuid.uuid4().hex, started_at=time.time())
     
-    def run_scraping():
-        try:
-            config = create_config(request.config)
-            manager = ScraperManager(config)
+    def run_scraping(locks: ExitStack):
+        with locks:
+            try:
+                config = create_config(request.config)
+                manager = ScraperManager(config)
+                results = manager.scrape_all_sources(google_drive_url)
+                
+                # Save results automatically
+                manager.save_results(results, str(PROJECT_ROOT / "output"))
+                logger.info("Background scraping completed and results saved")
+                
+                job.total_scraped = {source: result.total_scraped for source, result in results.items()}
+                job.finished_at = time.time()
+                job.status = "completed"
+                
+            except Exception as e:
+                logger.error(f"Background scraping failed: {e}")
+                job.error = str(e)
+                job.finished_at = time.time()
+                job.status = "failed"
             
-            google_drive_url = str(request.google_drive_pdf_url) if request.google_drive_pdf_url else None
-            results = manager.scrape_all_sources(google_drive_url)
+            # Recorded while the locks are still held, so pollers never see the job as orphaned
+            try:
+                save_job(job, request_lock)
+            except OSError as e:
+                logger.error(f"Failed to save background job {job.job_id}: {e}")
+    
+    def start_job() -> Dict[str, str]:
+        # Claims the locks and writes the job file, all blocking file I/O, so this runs in the threadpool.
+        # Every lock is released if any step fails before the job is handed to the executor.
+        with ExitStack() as locks:
+            # An identical scrape is already running in some worker: hand back its job instead of starting another
+            for _ in range(3):
+                request_fd = try_lock_file(request_lock)
+                if request_fd is not None:
+                    break
+                holder = read_lock_owner(request_lock)
+                if holder is not None:
+                    return {"job_id": holder, "message": "Identical scrape already running in background."}
+            else:
+                raise HTTPException(status_code=503, detail="Scraper busy: could not claim background job, retry later")
+            locks.callback(unlock_file, request_lock, request_fd, remove=True)
+            os.ftruncate(request_fd, 0)
+            os.write(request_fd, job.job_id.encode())
             
-            # Save results automatically
-            manager.save_results(results)
-            logger.info("Background scraping completed and results saved")
+            slot = claim_background_slot()
+            if slot is None:
+                raise HTTPException(status_code=503, detail="Scraper busy: too many background jobs running, retry later")
+            locks.callback(unlock_file, *slot)
             
-        except Exception as e:
-            logger.error(f"Background scraping failed: {e}")
+            prune_finished_jobs()
+            save_job(job, request_lock)
+            # From here on the job owns the locks and releases them when it finishes
+            job_locks = locks.pop_all()
+        
+        try:
+            background_executor.submit(run_scraping, job_locks)
+        except BaseException:
+            with job_locks:
+                job_path(job.job_id).unlink(missing_ok=True)
+            raise
+        
+        return {"job_id": job.job_id, "message": "Scraping started in background. Results will be saved to output directory."}
     
-    background_tasks.add_task(run_scraping)
-    return {"message": "Scraping started in background. Results will be saved to output directory."}
+    return await run_in_threadpool(start_job)
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str) -> JobState:
+    """Status of a background scrape job, whichever worker started it"""
+    job = await run_in_threadpool(load_job, job_id) if job_id.isalnum() else None
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+# Registered after the other /scrape/* routes, which it would otherwise shadow
+@app.post(
+    "/scrape/{source:path}",
+    response_model=None,
+    responses=SCRAPING_RESULT_RESPONSES,
+    description="Scrape one predefined source:\n\n" + "\n".join(
+        f"- `{source}`: {description}" for source, (_, _, _, description) in SCRAPE_SOURCES.items()
+    )
+)
+async def scrape_predefined_source(source: ScrapeSource, request: ScrapeRequest) -> Response:
+    validate_url(request.url, "url")
+    try:
+        result = await scrape_source(source.value, request.url, request.config)
+        
+        logger.info(f"{source.value} scrape completed: {result.total_scraped} entries")
+        return json_response(SCRAPING_RESULT_JSON, result)
+        
+    except Exception as e:
+        logger.error(f"Failed to scrape {source.value}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
 # Health check endpoint
-@app.get("/health")
+@app.get("/health", include_in_schema=False)
 async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "blog-scraper-api"}
 
+# API documentation, backed by the schema rendered at startup
+if API_DOCS_ENABLED:
+    @app.get("/openapi.json", include_in_schema=False)
+    async def openapi_json():
+        return Response(content=get_openapi_bytes(app), media_type="application/json")
+    
+    @app.get("/docs", include_in_schema=False)
+    async def swagger_ui():
+        return get_swagger_ui_html(openapi_url="/openapi.json", title=f"{app.title} - Swagger UI")
+    
+    @app.get("/redoc", include_in_schema=False)
+    async def redoc():
+        return get_redoc_html(openapi_url="/openapi.json", title=f"{app.title} - ReDoc")
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")